@@ -40,9 +40,12 @@ std::unique_ptr<ChatSession> ChatSession::load(const std::string& json_path,
         return nullptr;
     }
 
+    // Parse from a contiguous buffer rather than through the istream adapter.
+    std::ostringstream content;
+    content << file.rdbuf();
+
     try {
-        json j;
-        file >> j;
+        json j = json::parse(content.str());
 
         auto session = std::unique_ptr<ChatSession>(new ChatSession());
 
@@ -79,8 +82,8 @@ std::unique_ptr<ChatSession> ChatSession::load(const std::string& json_path,
             }
         }
 
-        // Open log file for appending
-        session->log_file_.open(session->log_path_, std::ios::out | std::ios::app);
+        // The log file is opened on the first write, so sessions that are only
+        // loaded to replay history never open it.
 
         return session;
     } catch (const json::exception&) {
@@ -131,8 +134,7 @@ void ChatSession::materialize() {
     json_oss << log_dir_ << "/" << chat_id_ << ".json";
     json_path_ = json_oss.str();
 
-    // Open log file
-    log_file_.open(log_path_, std::ios::out | std::ios::app);
+    // The log file is opened by the first log() call.
 }
 
 void ChatSession::add_user_message(const std::string& content) {
@@ -178,6 +180,11 @@ std::vector<Message> ChatSession::get_visible_messages() const {
 }
 
 void ChatSession::log(const std::string& role, const std::string& text) {
+    // Open the log once, on first use, and keep the stream for later messages.
+    if (!log_file_.is_open() && !log_path_.empty()) {
+        log_file_.open(log_path_, std::ios::out | std::ios::app);
+    }
+
     if (log_file_.is_open()) {
         // Convert role to uppercase for header
         std::string header = role;
@@ -216,7 +223,7 @@ void ChatSession::save_json() {
 
     std::ofstream file(json_path_);
     if (file.is_open()) {
-        file << j.dump(2) << std::endl;
+        file << j.dump(2) << '\n';
     }
 }
 
@@ -244,14 +251,61 @@ void ChatSession::update_title(const std::string& user_message) {
     title_ = first_line;
 }
 
+json trim_api_window(const json& window) {
+    json trimmed = json::array();
+    std::vector<const json*> turns;
+    for (const auto& item : window) {
+        if (item.is_object() && item.value("role", "") == "system") {
+            trimmed.push_back(item);
+        } else {
+            turns.push_back(&item);
+        }
+    }
+
+    size_t start = turns.size() / 2;
+    while (start < turns.size() &&
+           !(turns[start]->is_object() && turns[start]->value("role", "") == "user")) {
+        ++start;
+    }
+
+    for (size_t i = start; i < turns.size(); ++i) {
+        trimmed.push_back(*turns[i]);
+    }
+    return trimmed;
+}
+
 void maybe_compact_chat_window(
     providers::IAIProvider& provider,
     ChatSession& session,
     const std::string& model,
     const providers::ResponseUsage& usage
 ) {
-    // Check if provider supports compaction
+    // Providers without server-side compaction resend the whole window on
+    // every turn, so bound it by dropping the oldest turns instead. Their
+    // models are not in the built-in context table, so use the limit the
+    // provider reports and leave the window alone if it is unknown.
     if (!provider.chat().supports_compaction()) {
+        std::optional<providers::ModelInfo> info;
+        try {
+            info = provider.models().get_model_info(model);
+        } catch (const std::exception& e) {
+            std::cerr << "[Compact] Warning: Failed to look up model info: " << e.what() << std::endl;
+            return;
+        }
+        if (!info || info->max_context_tokens <= 0) {
+            return;
+        }
+
+        const int max_ctx = info->max_context_tokens;
+        const double fullness = static_cast<double>(usage.input_tokens) / static_cast<double>(max_ctx);
+        if (fullness <= 0.9) {
+            return;
+        }
+
+        std::cerr << "[Compact] Context is " << static_cast<int>(fullness * 100)
+                  << "% full (" << usage.input_tokens << "/" << max_ctx
+                  << " tokens), dropping oldest turns..." << std::endl;
+        session.set_api_window(trim_api_window(session.get_api_window()));
         return;
     }
 
@@ -109,7 +109,7 @@ private:
     size_t visible_start_index_ = 0;     // Index where visible messages begin (after hidden intro)
     std::string log_path_;               // Path to the markdown log file.
     std::string json_path_;              // Path to the JSON file.
-    std::ofstream log_file_;             // Open markdown log file stream.
+    std::ofstream log_file_;             // Markdown log file stream, opened on first write.
 
     // Private constructor for loading existing sessions.
     ChatSession();
@@ -118,7 +118,7 @@ private:
     // Called on first real user message.
     void materialize();
 
-    // Writes a message to the markdown log file.
+    // Writes a message to the markdown log file, opening it on first use.
     void log(const std::string& role, const std::string& text);
 
     // Saves the full conversation to the JSON file.
@@ -128,9 +128,17 @@ private:
     void update_title(const std::string& user_message);
 };
 
+/**
+ * Returns the API window with the oldest half of the conversation turns
+ * removed. System messages are kept, and the remainder starts on a user turn.
+ */
+nlohmann::json trim_api_window(const nlohmann::json& window);
+
 /**
  * Checks if the conversation window needs compaction (>90% of max context)
- * and compacts it if necessary.
+ * and compacts it if necessary. Providers without compaction support have
+ * the oldest half of the conversation dropped from the window instead, using
+ * the context limit the provider reports for the model.
  *
  * @param client OpenAI client for API calls
  * @param session Chat session to potentially compact
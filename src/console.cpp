@@ -7,7 +7,7 @@
 
 namespace rag {
 
-Console::Console() : colors_enabled_(true) {
+Console::Console() : colors_enabled_(true), status_enabled_(true) {
     enable_colors();
 }
 
@@ -95,6 +95,9 @@ void Console::print_colored(const std::string& text, const char* color) const {
 }
 
 void Console::start_status(const std::string& message) const {
+    if (!status_enabled_) {
+        return;
+    }
     if (colors_enabled_) {
         // Return to start of line, print message, clear to end of line
         std::cout << "\r" << ansi::YELLOW << message << ansi::RESET << "\033[K" << std::flush;
@@ -105,6 +108,9 @@ void Console::start_status(const std::string& message) const {
 }
 
 void Console::clear_status() const {
+    if (!status_enabled_) {
+        return;
+    }
     if (colors_enabled_) {
         // Move to beginning of line and clear it
         std::cout << "\r\033[K" << std::flush;
@@ -112,6 +118,10 @@ void Console::clear_status() const {
     // On dumb terminals, nothing to clear (each status was on its own line)
 }
 
+void Console::set_status_enabled(bool enabled) {
+    status_enabled_ = enabled;
+}
+
 std::string Console::prompt(const std::string& message, const std::string& default_value) const {
     if (!default_value.empty()) {
         std::cout << message << " [" << default_value << "]: ";
@@ -73,6 +73,10 @@ public:
     // Clears the current status line.
     void clear_status() const;
 
+    // Enables or disables status messages. When disabled, start_status and
+    // clear_status write nothing (used for non-interactive runs).
+    void set_status_enabled(bool enabled);
+
     // ========== Interactive Prompts ==========
 
     // Prompts the user for input with an optional default value.
@@ -88,6 +92,7 @@ public:
 
 private:
     bool colors_enabled_;  // True if terminal supports ANSI colors.
+    bool status_enabled_;  // True if status messages are shown.
 
     // Detects and enables color support based on terminal capabilities.
     void enable_colors();
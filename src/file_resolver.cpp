@@ -6,14 +6,42 @@
 #include <algorithm>
 #include <unordered_set>
 #include <regex>
+#include <iterator>
+#include <limits>
 
 namespace fs = std::filesystem;
 
 namespace rag {
 
+// Returns the length of the longest entry in SUPPORTED_EXTENSIONS.
+static size_t max_extension_length() {
+    static const size_t max_length = [] {
+        size_t length = 0;
+        for (const auto& ext : SUPPORTED_EXTENSIONS) {
+            length = std::max(length, ext.size());
+        }
+        return length;
+    }();
+    return max_length;
+}
+
 bool is_supported_extension(const std::string& filepath) {
-    fs::path p(filepath);
-    std::string ext = p.extension().string();
+    // Locate the extension directly in the string rather than building an
+    // fs::path, so only the short suffix is copied and lowercased.
+    size_t name_start = filepath.find_last_of('/');
+    name_start = (name_start == std::string::npos) ? 0 : name_start + 1;
+
+    size_t dot = filepath.rfind('.');
+    // A dot at the start of the filename marks a hidden file, not an extension.
+    if (dot == std::string::npos || dot <= name_start) {
+        return false;
+    }
+
+    if (filepath.size() - dot > max_extension_length()) {
+        return false;
+    }
+
+    std::string ext = filepath.substr(dot);
     // Convert to lowercase for case-insensitive comparison.
     std::transform(ext.begin(), ext.end(), ext.begin(), ::tolower);
     return SUPPORTED_EXTENSIONS.count(ext) > 0;
@@ -122,12 +150,12 @@ static std::string glob_to_regex(const std::string& glob) {
     return "^" + regex + "$";
 }
 
-// Returns true if path matches the glob pattern.
-static bool matches_glob(const std::string& path, const std::string& pattern) {
-    std::string regex_pattern = glob_to_regex(pattern);
+// Compiles a glob pattern into a regex once, so a directory walk can match
+// every file against it. Returns false if the pattern cannot be compiled.
+static bool compile_glob(const std::string& pattern, std::regex& re) {
     try {
-        std::regex re(regex_pattern);
-        return std::regex_match(path, re);
+        re.assign(glob_to_regex(pattern), std::regex::ECMAScript | std::regex::optimize);
+        return true;
     } catch (const std::regex_error&) {
         return false;
     }
@@ -135,51 +163,118 @@ static bool matches_glob(const std::string& path, const std::string& pattern) {
 
 // Returns true if pattern contains glob wildcard characters.
 static bool is_glob_pattern(const std::string& pattern) {
-    return pattern.find('*') != std::string::npos ||
-           pattern.find('?') != std::string::npos ||
-           pattern.find('[') != std::string::npos;
+    return pattern.find_first_of("*?[") != std::string::npos;
 }
 
-// Collects all supported files from a directory recursively.
-static void collect_files_recursive(const fs::path& dir, std::vector<std::string>& files) {
-    try {
-        for (const auto& entry : fs::recursive_directory_iterator(dir)) {
-            if (entry.is_regular_file() && is_supported_file(entry.path().string())) {
-                files.push_back(fs::absolute(entry.path()).string());
+// Returns the normalized absolute form of a path, used as the dedup key.
+static std::string absolute_path(const fs::path& p) {
+    return fs::absolute(p).lexically_normal().string();
+}
+
+// Returns true if c separates path components.
+static bool is_separator(char c) {
+    return c == '/' || c == static_cast<char>(fs::path::preferred_separator);
+}
+
+// Walks a directory recursively and invokes visit(entry, abs_path) for each
+// regular file, where abs_path is the file's normalized absolute path.
+// Entry types come from the cached directory entry, and unreadable
+// directories are skipped rather than aborting the whole walk. Directories
+// at max_depth (0 = entries directly inside dir) are not descended into.
+template <typename Visitor>
+static void walk_regular_files(
+    const fs::path& dir,
+    Visitor visit,
+    int max_depth = std::numeric_limits<int>::max()
+) {
+    // Only the root needs resolving against the working directory: the
+    // iterator never yields "." or "..", so each file's absolute path is
+    // the absolute root plus the part of its path below dir.
+    const std::string dir_str = dir.string();
+    std::string abs_root = absolute_path(dir);
+    if (abs_root.empty() || !is_separator(abs_root.back())) {
+        abs_root += static_cast<char>(fs::path::preferred_separator);
+    }
+
+    std::error_code ec;
+    fs::recursive_directory_iterator it(dir, fs::directory_options::skip_permission_denied, ec);
+    const fs::recursive_directory_iterator end;
+
+    for (; !ec && it != end; it.increment(ec)) {
+        std::error_code type_ec;
+        if (it->is_regular_file(type_ec)) {
+            const std::string path_str = it->path().string();
+            size_t offset = dir_str.size();
+            while (offset < path_str.size() && is_separator(path_str[offset])) {
+                offset++;
             }
+            std::string abs_path = abs_root;
+            abs_path.append(path_str, offset, std::string::npos);
+            visit(*it, std::move(abs_path));
+        } else if (it.depth() >= max_depth && it->is_directory(type_ec)) {
+            it.disable_recursion_pending();
         }
-    } catch (const fs::filesystem_error&) {
-        // Skip directories we can't access.
     }
 }
 
+// Counts the components of a path.
+static int count_components(const fs::path& p) {
+    return static_cast<int>(std::distance(p.begin(), p.end()));
+}
+
+// Collects all supported files from a directory recursively, skipping
+// files already in seen.
+static void collect_files_recursive(
+    const fs::path& dir,
+    std::vector<std::string>& files,
+    std::unordered_set<std::string>& seen
+) {
+    walk_regular_files(dir, [&](const fs::directory_entry&, std::string abs_path) {
+        if (seen.count(abs_path) == 0 && is_supported_file(abs_path)) {
+            seen.insert(abs_path);
+            files.push_back(std::move(abs_path));
+        }
+    });
+}
+
 std::vector<std::string> resolve_file_patterns(
     const std::vector<std::string>& patterns,
     Console& console
 ) {
     std::vector<std::string> files;
     std::unordered_set<std::string> seen;
+    std::unordered_set<std::string> seen_patterns;
 
     for (const auto& pattern : patterns) {
+        // Repeated patterns would only walk the same files again.
+        if (!seen_patterns.insert(pattern).second) {
+            continue;
+        }
+
         if (!is_glob_pattern(pattern)) {
             // Literal path - could be file or directory
             fs::path p(pattern);
 
-            if (!fs::exists(p)) {
+            // A single stat answers existence and type.
+            std::error_code ec;
+            fs::file_status status = fs::status(p, ec);
+
+            if (!fs::exists(status)) {
                 console.print_warning("Warning: File not found: " + pattern);
                 continue;
             }
 
-            if (fs::is_directory(p)) {
+            if (fs::is_directory(status)) {
                 // Directory - collect all supported files recursively
-                collect_files_recursive(p, files);
-            } else if (fs::is_regular_file(p)) {
+                collect_files_recursive(p, files, seen);
+            } else if (fs::is_regular_file(status)) {
+                std::string abs_path = absolute_path(p);
+                if (seen.count(abs_path) > 0) {
+                    continue;
+                }
                 if (is_supported_file(pattern)) {
-                    std::string abs_path = fs::absolute(p).string();
-                    if (seen.find(abs_path) == seen.end()) {
-                        seen.insert(abs_path);
-                        files.push_back(abs_path);
-                    }
+                    seen.insert(abs_path);
+                    files.push_back(std::move(abs_path));
                 } else {
                     console.print_warning("Warning: Unsupported file type (binary): " + pattern);
                 }
@@ -201,8 +296,11 @@ std::vector<std::string> resolve_file_patterns(
                 accumulated /= component;
             }
 
-            if (!accumulated.empty() && fs::exists(accumulated) && fs::is_directory(accumulated)) {
+            std::error_code ec;
+            int base_depth = 0;
+            if (!accumulated.empty() && fs::is_directory(accumulated, ec)) {
                 base_dir = accumulated;
+                base_depth = count_components(accumulated);
                 // Adjust glob_part to be relative to base_dir
                 glob_part = fs::relative(pattern_path, accumulated.parent_path()).string();
                 if (accumulated.parent_path().empty()) {
@@ -210,41 +308,45 @@ std::vector<std::string> resolve_file_patterns(
                 }
             }
 
+            std::regex glob_re;
+            if (!compile_glob(pattern, glob_re)) {
+                console.print_warning("Warning: No matches for pattern: " + pattern);
+                continue;
+            }
+
+            // Without "**" a match can only sit exactly as deep as the
+            // pattern, so there is no need to descend any further.
+            int max_depth = std::numeric_limits<int>::max();
+            if (pattern.find("**") == std::string::npos) {
+                max_depth = count_components(pattern_path) - base_depth - 1;
+            }
+
             // Collect all files from base directory and match against pattern
             bool found_match = false;
-            try {
-                for (const auto& entry : fs::recursive_directory_iterator(base_dir)) {
-                    if (!entry.is_regular_file()) continue;
-
-                    // Get path relative to current directory for matching
-                    std::string rel_path;
-                    if (base_dir == ".") {
-                        rel_path = entry.path().string();
-                        // Remove leading "./" if present
-                        if (rel_path.substr(0, 2) == "./") {
-                            rel_path = rel_path.substr(2);
-                        }
-                    } else {
-                        rel_path = entry.path().string();
+            walk_regular_files(base_dir, [&](const fs::directory_entry& entry, std::string abs_path) {
+                // Get path relative to current directory for matching
+                std::string rel_path = entry.path().string();
+                if (base_dir == "." && rel_path.compare(0, 2, "./") == 0) {
+                    // Remove leading "./" if present
+                    rel_path = rel_path.substr(2);
+                }
+
+                if (std::regex_match(rel_path, glob_re)) {
+                    if (seen.count(abs_path) > 0) {
+                        found_match = true;
+                        return;
                     }
 
-                    if (matches_glob(rel_path, pattern)) {
-                        if (!is_supported_file(entry.path().string())) {
-                            console.print_warning("Warning: Unsupported file type (binary): " + rel_path);
-                            continue;
-                        }
-
-                        std::string abs_path = fs::absolute(entry.path()).string();
-                        if (seen.find(abs_path) == seen.end()) {
-                            seen.insert(abs_path);
-                            files.push_back(abs_path);
-                            found_match = true;
-                        }
+                    if (!is_supported_file(abs_path)) {
+                        console.print_warning("Warning: Unsupported file type (binary): " + rel_path);
+                        return;
                     }
+
+                    seen.insert(abs_path);
+                    files.push_back(std::move(abs_path));
+                    found_match = true;
                 }
-            } catch (const fs::filesystem_error&) {
-                // Skip directories we can't access
-            }
+            }, max_depth);
 
             if (!found_match) {
                 console.print_warning("Warning: No matches for pattern: " + pattern);
@@ -252,18 +354,7 @@ std::vector<std::string> resolve_file_patterns(
         }
     }
 
-    // Remove duplicates while preserving order (already handled by seen set)
-    // But let's ensure the final list only contains unique entries
-    std::vector<std::string> unique_files;
-    std::unordered_set<std::string> final_seen;
-    for (const auto& f : files) {
-        if (final_seen.find(f) == final_seen.end()) {
-            final_seen.insert(f);
-            unique_files.push_back(f);
-        }
-    }
-
-    return unique_files;
+    return files;
 }
 
 } // namespace rag
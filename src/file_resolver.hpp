@@ -22,7 +22,7 @@ bool is_supported_extension(const std::string& filepath);
 bool is_text_file(const std::string& filepath);
 
 /**
- * Resolves glob patterns to a list of absolute file paths.
+ * Resolves glob patterns to a list of unique, normalized absolute file paths.
  *
  * Supports:
  *   - Literal file paths (e.g., "README.md")
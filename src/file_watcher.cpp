@@ -106,6 +106,7 @@ void FileWatcher::check_and_reindex() {
     // Create a quiet console for file resolution (suppresses warnings)
     // We use a local Console instance to avoid polluting output
     Console console;
+    console.set_status_enabled(false);
 
     // Resolve current files
     std::vector<std::string> current_files = resolve_file_patterns(
@@ -165,9 +166,7 @@ void FileWatcher::setup_watches() {
         fs::path p(pattern);
 
         // Check if pattern is a glob pattern
-        bool is_glob = pattern.find('*') != std::string::npos ||
-                       pattern.find('?') != std::string::npos ||
-                       pattern.find('[') != std::string::npos;
+        bool is_glob = pattern.find_first_of("*?[") != std::string::npos;
 
         if (!is_glob) {
             // Literal path
@@ -183,9 +182,7 @@ void FileWatcher::setup_watches() {
             fs::path base_dir = ".";
             for (const auto& component : p) {
                 std::string comp_str = component.string();
-                bool comp_is_glob = comp_str.find('*') != std::string::npos ||
-                                    comp_str.find('?') != std::string::npos ||
-                                    comp_str.find('[') != std::string::npos;
+                bool comp_is_glob = comp_str.find_first_of("*?[") != std::string::npos;
                 if (comp_is_glob) {
                     break;
                 }
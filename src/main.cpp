@@ -24,6 +24,7 @@
 #include <atomic>
 #include <chrono>
 #include <memory>
+#include <sstream>
 #include <unistd.h>
 #include <termios.h>
 
@@ -249,13 +250,17 @@ std::pair<Settings, std::unique_ptr<providers::IAIProvider>> load_or_create_sett
     auto existing = load_settings();
     bool has_valid_settings = existing.has_value() && existing->is_valid();
 
+    // Check the configured provider's API key before doing any other work.
+    if (has_valid_settings && get_api_key_for_provider(existing->provider).empty()) {
+        std::string env_var = (existing->provider == Provider::OpenAI) ? "OPEN_AI_API_KEY" : "GEMINI_API_KEY";
+        console.print_error("Error: " + env_var + " environment variable not set");
+        std::exit(1);
+    }
+
     // If rebuild is requested with existing valid settings, delete everything and recreate.
     if (rebuild && has_valid_settings) {
         Settings settings = *existing;
 
-        // Create provider based on existing settings
-        auto provider = create_provider(settings.provider);
-
         // Use new file patterns if provided, otherwise use stored patterns.
         std::vector<std::string> patterns_to_use = files.empty() ? settings.file_patterns : files;
 
@@ -270,6 +275,9 @@ std::pair<Settings, std::unique_ptr<providers::IAIProvider>> load_or_create_sett
             settings.file_patterns = files;
         }
 
+        // Create provider based on existing settings
+        auto provider = create_provider(settings.provider);
+
         // Rebuild the vector store from scratch
         std::string new_vector_store_id = rebuild_vector_store(
             settings.vector_store_id,
@@ -294,9 +302,6 @@ std::pair<Settings, std::unique_ptr<providers::IAIProvider>> load_or_create_sett
     if (reindex && has_valid_settings) {
         Settings settings = *existing;
 
-        // Create provider based on existing settings
-        auto provider = create_provider(settings.provider);
-
         // Use new file patterns if provided, otherwise use stored patterns.
         std::vector<std::string> patterns_to_use = files.empty() ? settings.file_patterns : files;
 
@@ -322,6 +327,9 @@ std::pair<Settings, std::unique_ptr<providers::IAIProvider>> load_or_create_sett
         // Compute diff.
         FileDiff diff = compute_file_diff(current_files, settings.indexed_files);
 
+        // Create provider based on existing settings
+        auto provider = create_provider(settings.provider);
+
         // Apply incremental updates.
         update_vector_store(settings.vector_store_id, diff, *provider, console, settings.indexed_files);
 
@@ -482,6 +490,7 @@ int main(int argc, char* argv[]) {
     terminal::save_original_settings();
 
     Console console;
+    console.set_status_enabled(!non_interactive);
     g_console = &console;
 
     // Set up signal handler for graceful Ctrl+C.
@@ -730,6 +739,13 @@ int main(int argc, char* argv[]) {
     // Markdown rendering: enabled for interactive mode without --plain.
     bool render_markdown = !non_interactive && !plain_output;
 
+    // Chat configuration shared by every query; only the previous response
+    // id changes between turns.
+    providers::ChatConfig chat_config;
+    chat_config.model = settings.model;
+    chat_config.reasoning_effort = reasoning_effort;
+    chat_config.knowledge_store_id = settings.vector_store_id;
+
     // Process a single query. If hidden is true, the user message won't be logged.
     // Returns true if completed normally, false if cancelled.
     auto process_query = [&](const std::string& user_input, bool hidden = false) -> bool {
@@ -801,11 +817,6 @@ int main(int argc, char* argv[]) {
         };
 
         try {
-            // Build chat configuration
-            providers::ChatConfig chat_config;
-            chat_config.model = settings.model;
-            chat_config.reasoning_effort = reasoning_effort;
-            chat_config.knowledge_store_id = settings.vector_store_id;
             chat_config.previous_response_id = chat.get_openai_response_id();
 
             StreamResult result;
@@ -837,7 +848,13 @@ int main(int argc, char* argv[]) {
 
                 renderer.finish();
             } else {
-                // Raw output for non-interactive or --plain mode.
+                // Raw output for non-interactive or --plain mode. Deltas are
+                // often only a few characters, so stdout is flushed at natural
+                // break points or once enough text has accumulated rather than
+                // after every delta.
+                constexpr size_t FLUSH_THRESHOLD = 64;
+                size_t unflushed_chars = 0;
+
                 result = provider->chat().stream_response(
                     chat_config,
                     chat.get_api_window(),
@@ -851,16 +868,20 @@ int main(int argc, char* argv[]) {
                             }
                             console.print_raw("\r\033[K");
                         }
-                        if (non_interactive) {
-                            std::cout << delta << std::flush;
-                        } else {
-                            console.print_raw(delta);
+                        console.print_raw(delta);
+                        unflushed_chars += delta.size();
+                        char last = delta.empty() ? '\0' : delta.back();
+                        if (last == '\n' || last == ' ' || last == '.' || last == ',' ||
+                            unflushed_chars >= FLUSH_THRESHOLD) {
                             console.flush();
+                            unflushed_chars = 0;
                         }
                         streamed_text += delta;
                     },
                     cancel_check
                 );
+
+                console.flush();
             }
 
             // Check if we were cancelled
@@ -939,14 +960,10 @@ int main(int argc, char* argv[]) {
 
     // Non-interactive mode.
     if (non_interactive) {
-        std::string user_input;
-        std::getline(std::cin, user_input);
-
-        // Read all remaining input if any.
-        std::string line;
-        while (std::getline(std::cin, line)) {
-            user_input += "\n" + line;
-        }
+        // Read all of stdin in one bulk copy rather than line by line.
+        std::ostringstream input_stream;
+        input_stream << std::cin.rdbuf();
+        std::string user_input = input_stream.str();
 
         // Trim whitespace.
         size_t start = user_input.find_first_not_of(" \t\n\r");
@@ -0,0 +1,28 @@
+#pragma once
+
+/**
+ * Process-wide libcurl initialization.
+ *
+ * curl_global_init sets up the TLS backend, which is comparatively expensive
+ * and must not run concurrently with other libcurl calls. Providers call
+ * ensure_curl_initialized() instead of pairing init/cleanup per instance, so
+ * the work happens once per process however many providers are created
+ * (server and MCP modes create more than one).
+ */
+
+#include <mutex>
+#include <curl/curl.h>
+
+namespace rag::providers {
+
+// Initializes libcurl on the first call; later calls return immediately.
+// No matching cleanup is registered: the process may exit (e.g. on SIGINT)
+// while a background thread still has a transfer in flight.
+inline void ensure_curl_initialized() {
+    static std::once_flag once;
+    std::call_once(once, [] {
+        curl_global_init(CURL_GLOBAL_DEFAULT);
+    });
+}
+
+} // namespace rag::providers
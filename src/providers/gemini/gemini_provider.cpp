@@ -1,5 +1,6 @@
 #include "gemini_provider.hpp"
 #include "../../verbose.hpp"
+#include "../curl_init.hpp"
 #include <stdexcept>
 #include <algorithm>
 #include <sstream>
@@ -9,6 +10,8 @@
 #include <fstream>
 #include <cstring>
 #include <map>
+#include <atomic>
+#include <mutex>
 
 namespace rag::providers::gemini {
 
@@ -90,24 +93,27 @@ static size_t stream_write_callback(char* ptr, size_t size, size_t nmemb, void*
 
     ctx->buffer.append(ptr, total_size);
 
-    // Process complete lines
+    // Process complete lines, tracking an offset into the buffer and erasing
+    // the consumed prefix once rather than shifting the buffer per line.
+    size_t start = 0;
     size_t pos;
-    while ((pos = ctx->buffer.find("\n")) != std::string::npos) {
-        std::string line = ctx->buffer.substr(0, pos);
-        ctx->buffer.erase(0, pos + 1);
-
-        if (!line.empty() && line.back() == '\r') {
-            line.pop_back();
+    while ((pos = ctx->buffer.find('\n', start)) != std::string::npos) {
+        size_t end = pos;
+        if (end > start && ctx->buffer[end - 1] == '\r') {
+            --end;
         }
 
         // Gemini SSE format: "data: {...json...}"
-        if (line.substr(0, 6) == "data: ") {
-            std::string data = line.substr(6);
+        if (end - start >= 6 && ctx->buffer.compare(start, 6, "data: ") == 0) {
+            std::string data = ctx->buffer.substr(start + 6, end - start - 6);
             if (!data.empty() && data != "[DONE]") {
                 ctx->on_data(data);
             }
         }
+
+        start = pos + 1;
     }
+    ctx->buffer.erase(0, start);
 
     return total_size;
 }
@@ -115,12 +121,10 @@ static size_t stream_write_callback(char* ptr, size_t size, size_t nmemb, void*
 GeminiProvider::GeminiProvider(const std::string& api_key, const std::string& api_base_url)
     : api_key_(api_key)
     , api_base_(api_base_url.empty() ? GEMINI_API_BASE : api_base_url) {
-    curl_global_init(CURL_GLOBAL_DEFAULT);
+    ensure_curl_initialized();
 }
 
-GeminiProvider::~GeminiProvider() {
-    curl_global_cleanup();
-}
+GeminiProvider::~GeminiProvider() = default;
 
 std::string GeminiProvider::build_url(const std::string& path) {
     // Gemini uses API key as query parameter
@@ -475,11 +479,16 @@ nlohmann::json GeminiProvider::messages_to_contents(const std::vector<Message>&
 }
 
 void GeminiProvider::wait_for_operation(const std::string& operation_name) {
-    // Poll the operation until it's done
-    const int max_attempts = 120;  // 10 minutes max
-    const int poll_interval_ms = 5000;  // 5 seconds
+    // Poll the operation until it's done, backing off exponentially so that
+    // quick imports are noticed promptly while slow ones are polled rarely.
+    const auto timeout = std::chrono::minutes(10);
+    const auto max_poll_interval = std::chrono::milliseconds(5000);
+    const double backoff_factor = 1.3;
 
-    for (int i = 0; i < max_attempts; ++i) {
+    auto deadline = std::chrono::steady_clock::now() + timeout;
+    auto poll_interval = std::chrono::milliseconds(200);
+
+    while (std::chrono::steady_clock::now() < deadline) {
         std::string response = http_get("/" + operation_name);
         json j = json::parse(response);
 
@@ -491,7 +500,9 @@ void GeminiProvider::wait_for_operation(const std::string& operation_name) {
         }
 
         rag::verbose_log("GEMINI", "Operation " + operation_name + " still in progress, waiting...");
-        std::this_thread::sleep_for(std::chrono::milliseconds(poll_interval_ms));
+        std::this_thread::sleep_for(poll_interval);
+        poll_interval = std::min(max_poll_interval, std::chrono::milliseconds(
+            static_cast<int64_t>(poll_interval.count() * backoff_factor)));
     }
 
     throw std::runtime_error("Operation timed out: " + operation_name);
@@ -500,6 +511,12 @@ void GeminiProvider::wait_for_operation(const std::string& operation_name) {
 // ========== IModelsService ==========
 
 std::vector<ModelInfo> GeminiProvider::list_models() {
+    std::lock_guard<std::mutex> lock(models_mutex_);
+    auto now = std::chrono::steady_clock::now();
+    if (!models_cache_.empty() && now - models_cached_at_ < MODEL_LIST_CACHE_TTL) {
+        return models_cache_;
+    }
+
     std::string response = http_get("/models");
     json j = json::parse(response);
 
@@ -546,6 +563,8 @@ std::vector<ModelInfo> GeminiProvider::list_models() {
         return a.id < b.id;
     });
 
+    models_cache_ = models;
+    models_cached_at_ = now;
     return models;
 }
 
@@ -753,30 +772,52 @@ std::string GeminiProvider::upload_file(const std::string& filepath) {
 std::vector<UploadResult> GeminiProvider::upload_files_parallel(
     const std::vector<std::string>& filepaths,
     ProgressCallback on_progress,
-    size_t /*max_parallel*/
+    size_t max_parallel
 ) {
-    // For simplicity, upload sequentially for now
-    // TODO: Implement parallel upload with curl multi
-    std::vector<UploadResult> results;
-    results.reserve(filepaths.size());
+    std::vector<UploadResult> results(filepaths.size());
+    if (filepaths.empty()) {
+        return results;
+    }
 
+    // Uploads are network-bound, so a small pool of worker threads each
+    // pulling the next file index is enough to overlap the round trips.
+    size_t worker_count = std::min(std::max<size_t>(max_parallel, 1), filepaths.size());
+    std::atomic<size_t> next_index{0};
     size_t completed = 0;
-    for (const auto& filepath : filepaths) {
-        UploadResult result;
-        result.filepath = filepath;
+    std::mutex progress_mutex;
 
-        try {
-            result.file_id = upload_file(filepath);
-        } catch (const std::exception& e) {
-            result.error = e.what();
-        }
+    auto worker = [&]() {
+        while (true) {
+            size_t idx = next_index.fetch_add(1);
+            if (idx >= filepaths.size()) {
+                return;
+            }
 
-        results.push_back(result);
-        completed++;
+            UploadResult& result = results[idx];
+            result.filepath = filepaths[idx];
 
-        if (on_progress) {
-            on_progress(completed, filepaths.size());
+            try {
+                result.file_id = upload_file(filepaths[idx]);
+            } catch (const std::exception& e) {
+                result.error = e.what();
+            }
+
+            // Progress callbacks write to the console, so serialize them.
+            std::lock_guard<std::mutex> lock(progress_mutex);
+            completed++;
+            if (on_progress) {
+                on_progress(completed, filepaths.size());
+            }
         }
+    };
+
+    std::vector<std::thread> workers;
+    workers.reserve(worker_count);
+    for (size_t i = 0; i < worker_count; ++i) {
+        workers.emplace_back(worker);
+    }
+    for (auto& t : workers) {
+        t.join();
     }
 
     return results;
@@ -1,5 +1,6 @@
 #include "openai_provider.hpp"
 #include "../../verbose.hpp"
+#include "../curl_init.hpp"
 #include <stdexcept>
 #include <algorithm>
 #include <sstream>
@@ -44,22 +45,26 @@ static size_t stream_write_callback(char* ptr, size_t size, size_t nmemb, void*
 
     ctx->buffer.append(ptr, total_size);
 
+    // Process complete lines, tracking an offset into the buffer and erasing
+    // the consumed prefix once rather than shifting the buffer per line.
+    size_t start = 0;
     size_t pos;
-    while ((pos = ctx->buffer.find("\n")) != std::string::npos) {
-        std::string line = ctx->buffer.substr(0, pos);
-        ctx->buffer.erase(0, pos + 1);
-
-        if (!line.empty() && line.back() == '\r') {
-            line.pop_back();
+    while ((pos = ctx->buffer.find('\n', start)) != std::string::npos) {
+        size_t end = pos;
+        if (end > start && ctx->buffer[end - 1] == '\r') {
+            --end;
         }
 
-        if (line.substr(0, 6) == "data: ") {
-            std::string data = line.substr(6);
+        if (end - start >= 6 && ctx->buffer.compare(start, 6, "data: ") == 0) {
+            std::string data = ctx->buffer.substr(start + 6, end - start - 6);
             if (data != "[DONE]") {
                 ctx->on_data(data);
             }
         }
+
+        start = pos + 1;
     }
+    ctx->buffer.erase(0, start);
 
     return total_size;
 }
@@ -67,12 +72,10 @@ static size_t stream_write_callback(char* ptr, size_t size, size_t nmemb, void*
 OpenAIProvider::OpenAIProvider(const std::string& api_key, const std::string& api_base_url)
     : api_key_(api_key)
     , api_base_(api_base_url.empty() ? OPENAI_API_BASE : api_base_url) {
-    curl_global_init(CURL_GLOBAL_DEFAULT);
+    ensure_curl_initialized();
 }
 
-OpenAIProvider::~OpenAIProvider() {
-    curl_global_cleanup();
-}
+OpenAIProvider::~OpenAIProvider() = default;
 
 std::string OpenAIProvider::http_get(const std::string& url) {
     rag::verbose_out("CURL", "GET " + url);
@@ -329,6 +332,12 @@ std::string OpenAIProvider::http_delete(const std::string& url) {
 // ========== IModelsService ==========
 
 std::vector<ModelInfo> OpenAIProvider::list_models() {
+    std::lock_guard<std::mutex> lock(models_mutex_);
+    auto now = std::chrono::steady_clock::now();
+    if (!models_cache_.empty() && now - models_cached_at_ < MODEL_LIST_CACHE_TTL) {
+        return models_cache_;
+    }
+
     std::string url = api_base_ + "/models";
     std::string response = http_get(url);
 
@@ -339,7 +348,7 @@ std::vector<ModelInfo> OpenAIProvider::list_models() {
         for (const auto& model : j["data"]) {
             std::string id = model.value("id", "");
             // Filter to gpt-5* models only
-            if (id.substr(0, 5) == "gpt-5") {
+            if (id.compare(0, 5, "gpt-5") == 0) {
                 ModelInfo info;
                 info.id = id;
                 info.display_name = id;
@@ -355,6 +364,8 @@ std::vector<ModelInfo> OpenAIProvider::list_models() {
         return a.id < b.id;
     });
 
+    models_cache_ = models;
+    models_cached_at_ = now;
     return models;
 }
 
@@ -9,6 +9,7 @@
 
 #include "../provider.hpp"
 #include <curl/curl.h>
+#include <mutex>
 
 namespace rag::providers::openai {
 
@@ -75,6 +76,7 @@ public:
     void remove_file(const std::string& store_id, const std::string& file_id) override;
     std::string get_operation_status(const std::string& store_id, const std::string& operation_id) override;
     bool supports_dedicated_stores() const override { return true; }
+    bool supports_atomic_batches() const override { return true; }
 
     // ========== IChatService ==========
     StreamResult stream_response(
@@ -118,6 +120,10 @@ private:
     std::string api_key_;
     std::string api_base_;
 
+    std::mutex models_mutex_;                                    // Guards the model list cache.
+    std::vector<ModelInfo> models_cache_;                        // Last result of list_models().
+    std::chrono::steady_clock::time_point models_cached_at_;     // When models_cache_ was fetched.
+
     // ========== HTTP Helpers ==========
     std::string http_get(const std::string& url);
     std::string http_post_json(const std::string& url, const nlohmann::json& body);
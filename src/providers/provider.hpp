@@ -9,11 +9,18 @@
  */
 
 #include "types.hpp"
+#include <chrono>
 #include <memory>
 #include <optional>
 
 namespace rag::providers {
 
+/**
+ * How long providers may reuse a fetched model list before asking the API again.
+ * The list rarely changes, and the web UI requests it on every page load.
+ */
+constexpr std::chrono::hours MODEL_LIST_CACHE_TTL{24};
+
 /**
  * Interface for listing and querying available models.
  */
@@ -23,7 +30,8 @@ public:
 
     /**
      * Lists available models from this provider.
-     * The list may be filtered to models relevant to this application.
+     * The list may be filtered to models relevant to this application, and
+     * may be served from a cache for up to MODEL_LIST_CACHE_TTL.
      */
     virtual std::vector<ModelInfo> list_models() = 0;
 
@@ -141,6 +149,13 @@ public:
      * If false, RAG may be implemented via inline context or other means.
      */
     virtual bool supports_dedicated_stores() const = 0;
+
+    /**
+     * Returns true if add_files attaches a batch as a single operation that
+     * completes or fails as a whole. If false, a failure partway through may
+     * leave some of the files attached.
+     */
+    virtual bool supports_atomic_batches() const = 0;
 };
 
 /**
@@ -2,6 +2,7 @@
 #include "config.hpp"
 #include <nlohmann/json.hpp>
 #include <fstream>
+#include <sstream>
 #include <filesystem>
 #include <algorithm>
 
@@ -48,9 +49,14 @@ std::optional<Settings> load_settings() {
         return std::nullopt;
     }
 
+    // Read the file in one go and parse from the contiguous buffer, which is
+    // much faster than parsing through the istream adapter one character at
+    // a time. The file grows with indexed files and chat history.
+    std::ostringstream content;
+    content << file.rdbuf();
+
     try {
-        json j;
-        file >> j;
+        json j = json::parse(content.str());
 
         Settings settings;
 
@@ -72,13 +78,32 @@ std::optional<Settings> load_settings() {
         }
 
         if (j.contains("indexed_files") && j["indexed_files"].is_object()) {
+            // Older versions could record paths such as "/cwd/./a.md", and
+            // sometimes the same file under both spellings. Already-normal
+            // keys are loaded first; an unnormalized key is then renamed to
+            // its normal form unless that is taken, in which case it keeps
+            // its old spelling. That key matches no resolved file, so the
+            // next update removes its duplicate upload from the store.
+            std::vector<std::pair<std::string, FileMetadata>> legacy_entries;
             for (const auto& [filepath, metadata] : j["indexed_files"].items()) {
                 FileMetadata fm;
                 // Support both new "file_id" and legacy "openai_file_id"
                 fm.file_id = metadata.value("file_id", metadata.value("openai_file_id", ""));
                 fm.last_modified = metadata.value("last_modified", int64_t(0));
                 fm.content_hash = metadata.value("content_hash", "");
-                settings.indexed_files[filepath] = fm;
+
+                std::string normalized = fs::path(filepath).lexically_normal().string();
+                if (normalized == filepath) {
+                    settings.indexed_files[filepath] = fm;
+                } else {
+                    legacy_entries.emplace_back(filepath, fm);
+                }
+            }
+            for (const auto& [filepath, fm] : legacy_entries) {
+                std::string normalized = fs::path(filepath).lexically_normal().string();
+                if (!settings.indexed_files.emplace(normalized, fm).second) {
+                    settings.indexed_files.emplace(filepath, fm);
+                }
             }
         }
 
@@ -176,7 +201,7 @@ void save_settings(const Settings& settings) {
 
     std::ofstream file(SETTINGS_FILE);
     if (file.is_open()) {
-        file << j.dump(2) << std::endl;
+        file << j.dump(2) << '\n';
     }
 }
 
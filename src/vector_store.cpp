@@ -8,6 +8,8 @@
 #include <fstream>
 #include <sstream>
 #include <iomanip>
+#include <algorithm>
+#include <future>
 
 namespace fs = std::filesystem;
 
@@ -97,6 +99,69 @@ FileDiff compute_file_diff(
     return diff;
 }
 
+// Outcome of waiting for a knowledge store batch operation.
+enum class IndexingResult {
+    Completed,  // The operation finished successfully.
+    Failed,     // The operation ended in a failed, cancelled or unknown status.
+    Unknown     // Polling itself failed; the operation may still finish.
+};
+
+// Polls a knowledge store batch operation until it reaches a terminal status.
+// Backs off exponentially so short jobs are noticed quickly while long ones
+// issue far fewer status requests. Any status other than "completed" or
+// "in_progress" is terminal. Prints an error unless the result is Completed.
+static IndexingResult wait_for_indexing(
+    const std::string& store_id,
+    const std::string& operation_id,
+    providers::IAIProvider& provider,
+    Console& console
+) {
+    constexpr auto INITIAL_POLL_DELAY = std::chrono::milliseconds(200);
+    constexpr auto MAX_POLL_DELAY = std::chrono::milliseconds(5000);
+    constexpr double POLL_BACKOFF_FACTOR = 1.3;
+
+    auto delay = INITIAL_POLL_DELAY;
+    while (true) {
+        try {
+            std::string status = provider.knowledge().get_operation_status(store_id, operation_id);
+
+            if (status == "completed") {
+                return IndexingResult::Completed;
+            } else if (status != "in_progress") {
+                // Failed, cancelled, or a status we do not recognise.
+                console.clear_status();
+                console.print_error("Error: Knowledge store indexing did not complete (status: " + status + ")");
+                return IndexingResult::Failed;
+            }
+        } catch (const std::exception& e) {
+            console.clear_status();
+            console.print_error("Error checking batch status: " + std::string(e.what()));
+            return IndexingResult::Unknown;
+        }
+
+        std::this_thread::sleep_for(delay);
+        delay = std::min(MAX_POLL_DELAY, std::chrono::milliseconds(
+            static_cast<int64_t>(delay.count() * POLL_BACKOFF_FACTOR)));
+    }
+}
+
+// Reads the mtime and content hash of each file on a background thread, so
+// the disk reads overlap with the uploads instead of following them. The
+// returned metadata has no file_id yet.
+static std::future<std::map<std::string, FileMetadata>> read_metadata_async(
+    std::vector<std::string> files
+) {
+    return std::async(std::launch::async, [files = std::move(files)]() {
+        std::map<std::string, FileMetadata> metadata;
+        for (const auto& filepath : files) {
+            FileMetadata& entry = metadata[filepath];
+            entry.last_modified = get_file_mtime(filepath);
+            entry.content_hash = compute_file_hash(filepath);
+        }
+        return metadata;
+    });
+}
+
 std::string create_vector_store(
     const std::vector<std::string>& file_patterns,
     providers::IAIProvider& provider,
@@ -122,6 +187,8 @@ std::string create_vector_store(
     // Clear any existing indexed files since we're creating fresh
     indexed_files.clear();
 
+    auto pending_metadata = read_metadata_async(files_to_upload);
+
     // Upload files in parallel
     auto results = provider.files().upload_files_parallel(
         files_to_upload,
@@ -134,16 +201,16 @@ std::string create_vector_store(
 
     console.clear_status();
 
+    auto file_metadata = pending_metadata.get();
+
     // Process results
     for (const auto& result : results) {
         if (result.success()) {
             file_ids.push_back(result.file_id);
 
             // Record the file metadata including content hash
-            FileMetadata metadata;
+            FileMetadata metadata = file_metadata[result.filepath];
             metadata.file_id = result.file_id;
-            metadata.last_modified = get_file_mtime(result.filepath);
-            metadata.content_hash = compute_file_hash(result.filepath);
             indexed_files[result.filepath] = metadata;
 
             console.print_success(result.filepath);
@@ -183,25 +250,8 @@ std::string create_vector_store(
     console.start_status("Indexing " + std::to_string(file_ids.size()) +
                         " files (this may take a minute)...");
 
-    // Poll for batch completion
-    while (true) {
-        try {
-            std::string status = provider.knowledge().get_operation_status(store_id, operation_id);
-
-            if (status == "completed") {
-                break;
-            } else if (status == "failed") {
-                console.clear_status();
-                console.print_error("Error: Knowledge store indexing failed");
-                return "";
-            }
-
-            std::this_thread::sleep_for(std::chrono::seconds(1));
-        } catch (const std::exception& e) {
-            console.clear_status();
-            console.print_error("Error checking batch status: " + std::string(e.what()));
-            return "";
-        }
+    if (wait_for_indexing(store_id, operation_id, provider, console) != IndexingResult::Completed) {
+        return "";
     }
 
     console.clear_status();
@@ -237,6 +287,9 @@ void update_vector_store(
     }
     console.println();
 
+    // Cleared whenever any file could not be removed, updated or added.
+    bool complete = true;
+
     // Process removals first
     for (const auto& filepath : diff.removed) {
         auto it = indexed_files.find(filepath);
@@ -271,6 +324,7 @@ void update_vector_store(
                 console.clear_status();
                 console.print_error("Failed to remove " + filepath + ": " + e.what());
                 removal_ok = false;
+                complete = false;
             }
 
             if (removal_ok) {
@@ -281,7 +335,11 @@ void update_vector_store(
         }
     }
 
-    // Process modifications (remove old, add new)
+    // Process modifications: remove the old versions here, then re-upload
+    // them together with the additions below.
+    std::vector<std::string> to_upload;
+    to_upload.reserve(diff.modified.size() + diff.added.size());
+
     for (const auto& filepath : diff.modified) {
         auto it = indexed_files.find(filepath);
         if (it != indexed_files.end()) {
@@ -314,54 +372,145 @@ void update_vector_store(
                     }
                 }
 
-                // Upload new version
-                std::string new_file_id = provider.files().upload_file(filepath);
-                // Add to knowledge store
-                provider.knowledge().add_file(store_id, new_file_id);
-
-                // Update metadata including content hash
-                it->second.file_id = new_file_id;
-                it->second.last_modified = get_file_mtime(filepath);
-                it->second.content_hash = compute_file_hash(filepath);
-
                 console.clear_status();
-                console.print_info("~ " + filepath);
+                to_upload.push_back(filepath);
             } catch (const std::exception& e) {
                 console.clear_status();
                 console.print_error("Failed to update " + filepath + ": " + e.what());
+                complete = false;
                 // Continue with other files
             }
         }
     }
 
-    // Process additions
-    for (const auto& filepath : diff.added) {
-        std::string display_name = fs::path(filepath).filename().string();
-        console.start_status("Adding: " + display_name);
+    to_upload.insert(to_upload.end(), diff.added.begin(), diff.added.end());
 
-        try {
-            // Upload file
-            std::string file_id = provider.files().upload_file(filepath);
-            // Add to knowledge store
-            provider.knowledge().add_file(store_id, file_id);
+    if (!to_upload.empty()) {
+        auto pending_metadata = read_metadata_async(to_upload);
 
-            // Record metadata including content hash
-            FileMetadata metadata;
-            metadata.file_id = file_id;
-            metadata.last_modified = get_file_mtime(filepath);
-            metadata.content_hash = compute_file_hash(filepath);
-            indexed_files[filepath] = metadata;
+        // Upload new and modified files in parallel
+        auto results = provider.files().upload_files_parallel(
+            to_upload,
+            [&console](size_t completed, size_t total) {
+                console.start_status("Uploading (" + std::to_string(completed) + "/" +
+                                    std::to_string(total) + ")...");
+            },
+            8  // max parallel connections
+        );
+
+        console.clear_status();
+
+        auto file_metadata = pending_metadata.get();
+
+        std::vector<const providers::UploadResult*> uploaded;
+        std::vector<std::string> new_file_ids;
+        for (const auto& result : results) {
+            if (result.success()) {
+                uploaded.push_back(&result);
+                new_file_ids.push_back(result.file_id);
+            } else {
+                complete = false;
+                bool is_modified = indexed_files.count(result.filepath) > 0;
+                console.print_error(std::string(is_modified ? "Failed to update " : "Failed to add ") +
+                                    result.filepath + ": " + result.error);
+            }
+        }
+
+        // Uploads that made it into the store, those that definitely did
+        // not and must be removed again so they are not orphaned, and those
+        // whose batch outcome could not be determined.
+        std::vector<const providers::UploadResult*> attached;
+        std::vector<std::string> unattached_ids;
+        std::vector<const providers::UploadResult*> undetermined;
+
+        if (!uploaded.empty() && provider.knowledge().supports_atomic_batches()) {
+            // Attach all uploads to the store as one batch rather than
+            // issuing a separate request per file.
+            console.start_status("Indexing " + std::to_string(new_file_ids.size()) + " files...");
+
+            IndexingResult indexing = IndexingResult::Failed;
+            try {
+                std::string operation_id = provider.knowledge().add_files(store_id, new_file_ids);
+                indexing = wait_for_indexing(store_id, operation_id, provider, console);
+            } catch (const std::exception& e) {
+                console.clear_status();
+                console.print_error("Failed to add files to store: " + std::string(e.what()));
+            }
 
             console.clear_status();
-            console.print_success("+ " + filepath);
-        } catch (const std::exception& e) {
-            console.clear_status();
-            console.print_error("Failed to add " + filepath + ": " + e.what());
-            // Continue with other files
+            if (indexing == IndexingResult::Completed) {
+                attached = uploaded;
+            } else if (indexing == IndexingResult::Failed) {
+                unattached_ids = new_file_ids;
+            } else {
+                // The batch may still complete on the server, so deleting
+                // the uploads could leave the store with neither version.
+                undetermined = uploaded;
+            }
+        } else {
+            // The provider's batch stops at the first failure and leaves the
+            // earlier files attached, so attach one file at a time instead.
+            for (const auto* result : uploaded) {
+                std::string display_name = fs::path(result->filepath).filename().string();
+                console.start_status("Indexing: " + display_name);
+
+                try {
+                    provider.knowledge().add_file(store_id, result->file_id);
+                    console.clear_status();
+                    attached.push_back(result);
+                } catch (const std::exception& e) {
+                    console.clear_status();
+                    bool is_modified = indexed_files.count(result->filepath) > 0;
+                    console.print_error(std::string(is_modified ? "Failed to update " : "Failed to add ") +
+                                        result->filepath + ": " + e.what());
+                    unattached_ids.push_back(result->file_id);
+                }
+            }
+        }
+
+        for (const auto* result : attached) {
+            bool is_modified = indexed_files.count(result->filepath) > 0;
+
+            // Record metadata including content hash
+            FileMetadata metadata = file_metadata[result->filepath];
+            metadata.file_id = result->file_id;
+            indexed_files[result->filepath] = metadata;
+
+            if (is_modified) {
+                console.print_info("~ " + result->filepath);
+            } else {
+                console.print_success("+ " + result->filepath);
+            }
+        }
+
+        if (!unattached_ids.empty()) {
+            complete = false;
+            // Pass the store so any files the batch did attach are removed
+            // from it before being deleted.
+            auto deleted = provider.files().delete_files_parallel(unattached_ids, store_id);
+            for (const auto& result : deleted) {
+                if (!result.success()) {
+                    console.print_warning("Failed to clean up uploaded file " + result.file_id +
+                                          ": " + result.error);
+                }
+            }
+        }
+
+        if (!undetermined.empty()) {
+            complete = false;
+            console.print_warning("Indexing status unknown; these uploads were kept but not recorded:");
+            for (const auto* result : undetermined) {
+                console.println("  " + result->filepath + " (" + result->file_id + ")");
+            }
+            console.println("If they appear twice after the next reindex, run 'crag --rebuild'.");
         }
     }
 
     console.println();
+    if (!complete) {
+        console.print_warning("Knowledge store partially updated. Failed files will be retried on the next reindex.");
+        return;
+    }
     console.print_success("Knowledge store updated.");
 }
 
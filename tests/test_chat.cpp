@@ -0,0 +1,59 @@
+#define CATCH_CONFIG_MAIN
+#include <catch2/catch.hpp>
+#include "chat.hpp"
+
+using namespace rag;
+using json = nlohmann::json;
+
+// Helper to build a message in the API window format
+static json message(const std::string& role, const std::string& content) {
+    return {{"role", role}, {"content", content}};
+}
+
+TEST_CASE("trim_api_window keeps system messages", "[chat]") {
+    json window = json::array({
+        message("system", "prompt"),
+        message("user", "q1"),
+        message("assistant", "a1"),
+        message("user", "q2"),
+        message("assistant", "a2"),
+    });
+
+    json trimmed = trim_api_window(window);
+
+    REQUIRE(trimmed.size() == 3);
+    CHECK(trimmed[0] == message("system", "prompt"));
+    CHECK(trimmed[1] == message("user", "q2"));
+    CHECK(trimmed[2] == message("assistant", "a2"));
+}
+
+TEST_CASE("trim_api_window starts on a user turn", "[chat]") {
+    json window = json::array({
+        message("system", "prompt"),
+        message("user", "q1"),
+        message("assistant", "a1"),
+        message("assistant", "a1 continued"),
+        message("user", "q2"),
+        message("assistant", "a2"),
+    });
+
+    json trimmed = trim_api_window(window);
+
+    REQUIRE(trimmed.size() == 3);
+    CHECK(trimmed[0] == message("system", "prompt"));
+    CHECK(trimmed[1] == message("user", "q2"));
+    CHECK(trimmed[2] == message("assistant", "a2"));
+}
+
+TEST_CASE("trim_api_window collapses a single exchange to the system prompt", "[chat]") {
+    json window = json::array({
+        message("system", "prompt"),
+        message("user", "q1"),
+        message("assistant", "a1"),
+    });
+
+    json trimmed = trim_api_window(window);
+
+    REQUIRE(trimmed.size() == 1);
+    CHECK(trimmed[0] == message("system", "prompt"));
+}